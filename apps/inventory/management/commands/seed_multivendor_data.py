@@ -12,13 +12,23 @@ Usage:
     python manage.py seed_multivendor_data --flush       # flush and re-seed
     python manage.py seed_multivendor_data --flush-only  # flush without re-seeding
     python manage.py seed_multivendor_data --vendor aws  # seed only AWS
+
+The vendor tables below are shared, read-only reference data. Each
+resource's ``properties`` is frozen into a ``MappingProxyType`` at import
+time, so seeding code must copy it (``dict(...)``) before handing it to
+the ORM rather than mutating the shared table.
 """
 
+import json
+import os
 import uuid
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from types import MappingProxyType
 
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.utils import timezone
 
 from apps.core.models import Organization
@@ -32,6 +42,35 @@ from apps.inventory.models import (
 )
 
 
+# Rows per INSERT for the bulk_create calls below; bounded so one vendor
+# never turns into a single oversized statement.
+BULK_BATCH_SIZE = int(os.environ.get("SEED_BULK_BATCH_SIZE", "500"))
+
+# Columns streamed by _copy_sightings(), in COPY order; seen_at is left
+# to its DEFAULT now()
+SIGHTING_COPY_COLUMNS = (
+    "id", "resource_id", "collection_run_id", "state",
+    "power_state", "cpu_count", "memory_mb", "disk_gb", "metrics",
+)
+
+
+def _copy_sightings(sightings):
+    """Stream sightings into PostgreSQL with COPY FROM STDIN.
+
+    COPY bypasses model defaults, so the Python-side UUID ``id`` is written
+    explicitly; ``seen_at`` comes from the column's database default.
+    """
+    table = connection.ops.quote_name(ResourceSighting._meta.db_table)
+    sql = f"COPY {table} ({', '.join(SIGHTING_COPY_COLUMNS)}) FROM STDIN"
+    with connection.cursor() as cursor, cursor.copy(sql) as copy:
+        for s in sightings:
+            copy.write_row((
+                s.id, s.resource_id, s.collection_run_id, s.state,
+                s.power_state, s.cpu_count, s.memory_mb, s.disk_gb,
+                json.dumps(s.metrics),
+            ))
+
+
 # Deterministic UUIDs for canonical_id (seeded from name)
 def _canon(name):
     return str(uuid.uuid5(uuid.NAMESPACE_DNS, name))
@@ -481,6 +520,15 @@ VENDOR_REGISTRY = {
 }
 
 
+def _freeze_properties():
+    for _prov, resources, _rels in VENDOR_REGISTRY.values():
+        for rdata in resources:
+            rdata["properties"] = MappingProxyType(rdata.get("properties", {}))
+
+
+_freeze_properties()
+
+
 class Command(BaseCommand):
     help = "Seed multi-vendor inventory data (AWS, Azure, GCP, OpenStack, OpenShift)"
 
@@ -489,8 +537,11 @@ class Command(BaseCommand):
         parser.add_argument("--flush-only", action="store_true", help="Flush without re-seeding")
         parser.add_argument("--vendor", type=str, choices=list(VENDOR_REGISTRY.keys()),
                             help="Seed only a specific vendor")
+        parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE,
+                            help="Rows per bulk INSERT (default: $SEED_BULK_BATCH_SIZE or 500)")
 
     def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
         if options["flush"] or options["flush_only"]:
             self._flush(options.get("vendor"))
             if options["flush_only"]:
@@ -502,28 +553,98 @@ class Command(BaseCommand):
             self.stderr.write("No Organization found. Run seed_vmware_data first.")
             return
 
-        for vendor_key in vendors:
-            prov_data, resources_data, rels_data = VENDOR_REGISTRY[vendor_key]
-            self._seed_vendor(org, vendor_key, prov_data, resources_data, rels_data)
-
-        self.stdout.write(self.style.SUCCESS(f"Seeded {len(vendors)} vendor(s) successfully."))
-
+        # Every vendor shares the same 7-day run cadence: (completed_at, days_ago)
+        now = timezone.now()
+        run_specs = [
+            (now - timedelta(days=days_ago) + timedelta(minutes=2), days_ago)
+            for days_ago in range(7, -1, -1)
+        ]
+
+        # Vendors touch disjoint providers and resources, so on PostgreSQL
+        # they are seeded concurrently, each thread on its own connection and
+        # in its own transaction. SQLite serialises writers, so stay serial.
+        # Also stay serial inside an outer atomic() block (call_command from a
+        # TestCase, say): other connections can't see its uncommitted rows.
+        #
+        # Either way each vendor commits on its own, so a failure leaves the
+        # vendors that finished in place. Seeding is idempotent (get_or_create
+        # and upserts), so re-running the command fills in the rest.
+        if (connection.vendor == "postgresql" and len(vendors) > 1
+                and not connection.in_atomic_block):
+            with ThreadPoolExecutor(max_workers=min(8, len(vendors))) as pool:
+                futures = {
+                    vendor_key: pool.submit(
+                        self._seed_vendor_in_thread, org, vendor_key,
+                        *VENDOR_REGISTRY[vendor_key], run_specs,
+                        batch_size=options["batch_size"],
+                        verbosity=self.verbosity,
+                    )
+                    for vendor_key in vendors
+                }
+            summaries = []
+            failed = []
+            for vendor_key, future in futures.items():
+                try:
+                    summaries.append(future.result())
+                except Exception as exc:
+                    failed.append((vendor_key, exc))
+            if failed:
+                for vendor_key, exc in failed:
+                    self.stderr.write(f"  {vendor_key}: {exc}")
+                self.stderr.write(
+                    f"Seeding failed for {', '.join(vk for vk, _ in failed)}; "
+                    f"{len(summaries)} other vendor(s) were committed. Re-run to retry."
+                )
+                raise failed[0][1]
+        else:
+            summaries = []
+            for vendor_key in vendors:
+                prov_data, resources_data, rels_data = VENDOR_REGISTRY[vendor_key]
+                summaries.append(self._seed_vendor(
+                    org, vendor_key, prov_data, resources_data, rels_data,
+                    run_specs, batch_size=options["batch_size"],
+                    verbosity=self.verbosity,
+                ))
+
+        # One report at the end; per-vendor lines would interleave across threads
+        lines = [
+            f"  {s['provider']} [{s['status']}]: {s['resources']} resources, "
+            f"{s['relationships']} relationships"
+            + (f", {s['skipped']} skipped (unknown type)" if s["skipped"] else "")
+            for s in summaries
+        ]
+        lines.append(self.style.SUCCESS(f"Seeded {len(vendors)} vendor(s) successfully."))
+        self.stdout.write("\n".join(lines))
+
+    @transaction.atomic
     def _flush(self, vendor_filter=None):
         vendors = [vendor_filter] if vendor_filter else list(VENDOR_REGISTRY.keys())
-        for vk in vendors:
-            prov_data = VENDOR_REGISTRY[vk][0]
-            provs = Provider.objects.filter(name=prov_data["name"])
-            if provs.exists():
-                # Cascade deletes resources, sightings, relationships via FK
-                count = provs.count()
-                provs.delete()
-                self.stdout.write(f"Flushed {count} provider(s) for {vk}")
-
-    def _seed_vendor(self, org, vendor_key, prov_data, resources_data, rels_data):
+        names = [VENDOR_REGISTRY[vk][0]["name"] for vk in vendors]
+        # One cascade for every requested vendor instead of one per vendor.
+        # The FKs are enforced by Django rather than ON DELETE CASCADE, so a
+        # raw TRUNCATE would either fail or wipe providers (and collected
+        # inventory) this command never created.
+        _, per_model = Provider.objects.filter(name__in=names).delete()
+        count = per_model.get(Provider._meta.label, 0)
+        if count:
+            self.stdout.write(f"Flushed {count} provider(s) for {', '.join(vendors)}")
+
+    def _seed_vendor_in_thread(self, *args, **kwargs):
+        try:
+            return self._seed_vendor(*args, **kwargs)
+        finally:
+            # Worker threads open their own connection; don't leak it
+            connection.close()
+
+    @transaction.atomic
+    def _seed_vendor(self, org, vendor_key, prov_data, resources_data, rels_data,
+                     run_specs, batch_size=BULK_BATCH_SIZE, verbosity=1):
         now = timezone.now()
+        # Seeded per vendor so metric samples are reproducible, like _canon()
+        rng = random.Random(vendor_key)
 
         # ── Create Provider ────────────────────────────────────────────
-        provider, created = Provider.objects.get_or_create(
+        provider, created = Provider.objects.select_related("organization").get_or_create(
             name=prov_data["name"], organization=org,
             defaults={
                 "vendor": prov_data["vendor"],
@@ -537,42 +658,44 @@ class Command(BaseCommand):
             },
         )
         status = "created" if created else "exists"
-        self.stdout.write(f"  Provider '{provider.name}' [{status}]")
 
         # ── Historical collection runs (7 days) ────────────────────────
-        runs = []
-        for days_ago in range(7, -1, -1):
-            run_time = now - timedelta(days=days_ago)
-            run = CollectionRun.objects.create(
+        # One multi-row INSERT; PKs come back via RETURNING on PostgreSQL
+        # (and SQLite 3.35+), which the sightings below rely on.
+        runs = CollectionRun.objects.bulk_create([
+            CollectionRun(
                 provider=provider,
-                completed_at=run_time + timedelta(minutes=2),
+                completed_at=completed_at,
                 status="completed",
                 collection_type="full",
                 resources_found=len(resources_data),
                 resources_created=len(resources_data) if days_ago == 7 else 0,
                 resources_updated=0 if days_ago == 7 else len(resources_data),
             )
-
-
-
-
-
-
-
-
-
-
-
-            runs.append(run)
+            for completed_at, days_ago in run_specs
+        ], batch_size=batch_size)
 
         # ── Create Resources ───────────────────────────────────────────
+        rt_by_slug = ResourceType.objects.in_bulk(
+            {rdata["type"] for rdata in resources_data}, field_name="slug",
+        )
+        canon_ids = [_canon(rdata["name"]) for rdata in resources_data]
+        bios_ids = {
+            rdata["name"]: _bios(rdata["name"])
+            for rdata in resources_data if rdata["type"] == "virtual_machine"
+        }
         resource_map = {}
-        for rdata in resources_data:
-            rt = ResourceType.objects.filter(slug=rdata["type"]).first()
+        seeded = []
+        skipped = 0
+        to_upsert = []
+        for rdata, canon_id in zip(resources_data, canon_ids):
+            rt = rt_by_slug.get(rdata["type"])
             if not rt:
-                self.stderr.write(
-                    f"    WARNING: ResourceType slug '{rdata['type']}' not found. Skipping '{rdata['name']}'."
-                )
+                skipped += 1
+                if verbosity >= 2:
+                    self.stderr.write(
+                        f"    WARNING: ResourceType slug '{rdata['type']}' not found. Skipping '{rdata['name']}'."
+                    )
                 continue
 
             # Resolve relative timestamps
@@ -584,74 +707,109 @@ class Command(BaseCommand):
                 ems_created_on = now + timedelta(days=rdata["ems_created_on"])
 
             # Build vendor_identifiers with smbios fallback
-            vi = rdata.get("vendor_identifiers", {})
+            vi = dict(rdata.get("vendor_identifiers") or {})
             if vi.get("smbios_uuid") is None and rdata["type"] == "virtual_machine":
-                vi["smbios_uuid"] = _bios(rdata["name"])
+                vi["smbios_uuid"] = bios_ids[rdata["name"]]
 
-            resource, rc = Resource.objects.get_or_create(
-                canonical_id=_canon(rdata["name"]),
+            resource = Resource(
+                canonical_id=canon_id,
                 organization=org,
-                defaults={
-                    "name": rdata["name"],
-                    "resource_type": rt,
-                    "provider": provider,
-                    "ems_ref": rdata["ems_ref"],
-                    "vendor_type": rdata.get("vendor_type", ""),
-                    "state": rdata.get("state", "active"),
-                    "power_state": rdata.get("power_state", ""),
-                    "region": rdata.get("region", ""),
-                    "availability_zone": rdata.get("availability_zone", ""),
-                    "cpu_count": rdata.get("cpu_count"),
-                    "memory_mb": rdata.get("memory_mb"),
-                    "disk_gb": rdata.get("disk_gb"),
-                    "os_type": rdata.get("os_type", ""),
-                    "os_name": rdata.get("os_name", ""),
-                    "ip_addresses": rdata.get("ip_addresses", []),
-                    "fqdn": rdata.get("fqdn", ""),
-                    "flavor": rdata.get("flavor", ""),
-                    "cloud_tenant": rdata.get("cloud_tenant", ""),
-                    "description": rdata.get("description", ""),
-                    "boot_time": boot_time,
-                    "ems_created_on": ems_created_on,
-                    "vendor_identifiers": vi,
-                    "properties": rdata.get("properties", {}),
-                    "first_discovered_at": now - timedelta(days=7),
-                    "last_seen_at": now,
-                },
+                name=rdata["name"],
+                resource_type=rt,
+                provider=provider,
+                ems_ref=rdata["ems_ref"],
+                vendor_type=rdata.get("vendor_type", ""),
+                state=rdata.get("state", "active"),
+                power_state=rdata.get("power_state", ""),
+                region=rdata.get("region", ""),
+                availability_zone=rdata.get("availability_zone", ""),
+                cpu_count=rdata.get("cpu_count"),
+                memory_mb=rdata.get("memory_mb"),
+                disk_gb=rdata.get("disk_gb"),
+                os_type=rdata.get("os_type", ""),
+                os_name=rdata.get("os_name", ""),
+                ip_addresses=rdata.get("ip_addresses", []),
+                fqdn=rdata.get("fqdn", ""),
+                flavor=rdata.get("flavor", ""),
+                cloud_tenant=rdata.get("cloud_tenant", ""),
+                description=rdata.get("description", ""),
+                boot_time=boot_time,
+                ems_created_on=ems_created_on,
+                vendor_identifiers=vi,
+                properties=dict(rdata["properties"]),
+                first_discovered_at=now - timedelta(days=7),
+                last_seen_at=now,
             )
+            to_upsert.append(resource)
             resource_map[rdata["name"]] = resource
-
-            # ── Sightings for each collection run ──────────────────────
+            seeded.append(rdata)
+
+        # INSERT ... ON CONFLICT (provider, ems_ref) DO UPDATE: one statement
+        # per batch replaces the SELECT + INSERT pair per resource.
+        Resource.objects.bulk_create(
+            to_upsert,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["provider", "ems_ref"],
+            update_fields=[
+                "name", "state", "power_state", "cpu_count", "memory_mb", "disk_gb",
+                "vendor_identifiers", "properties", "last_seen_at",
+            ],
+        )
+        # The UUID pk is assigned client-side, so bulk_create keeps the fresh
+        # value even when the row already existed; read back the stored ids.
+        pk_by_ref = dict(
+            Resource.objects.filter(
+                provider=provider, ems_ref__in=[r.ems_ref for r in to_upsert],
+            ).values_list("ems_ref", "pk")
+        )
+        for resource in to_upsert:
+            resource.pk = pk_by_ref[resource.ems_ref]
+
+        # ── Sightings for each collection run ──────────────────────────
+        sightings_buf = []
+        for rdata in seeded:
+            resource = resource_map[rdata["name"]]
+            # Everything but the metric samples is identical across runs
+            snapshot = {
+                "state": rdata.get("state", "active"),
+                "power_state": rdata.get("power_state", ""),
+                "cpu_count": rdata.get("cpu_count"),
+                "memory_mb": rdata.get("memory_mb"),
+                "disk_gb": rdata.get("disk_gb"),
+            }
+            sampled = rdata["type"] == "virtual_machine" and rdata.get("power_state") == "on"
             for run in runs:
-                metrics = {}
-                if rdata["type"] == "virtual_machine" and rdata.get("power_state") == "on":
-                    metrics = {
-                        "cpu_usage_percent": round(random.uniform(15, 85), 1),
-                        "memory_usage_percent": round(random.uniform(30, 90), 1),
-                    }
-                ResourceSighting.objects.get_or_create(
-                    resource=resource,
-                    collection_run=run,
-                    defaults={
-                        "state": rdata.get("state", "active"),
-                        "power_state": rdata.get("power_state", ""),
-                        "cpu_count": rdata.get("cpu_count"),
-                        "memory_mb": rdata.get("memory_mb"),
-                        "disk_gb": rdata.get("disk_gb"),
-                        "metrics": metrics,
-                    },
-                )
-
-        self.stdout.write(f"    {len(resource_map)} resources seeded")
+                metrics = {
+                    "cpu_usage_percent": round(rng.uniform(15, 85), 1),
+                    "memory_usage_percent": round(rng.uniform(30, 90), 1),
+                } if sampled else {}
+                sightings_buf.append(ResourceSighting(
+                    resource=resource, collection_run=run, metrics=metrics, **snapshot,
+                ))
+
+        if connection.vendor == "postgresql":
+            # Every run above is new, so (resource, collection_run) cannot
+            # collide and COPY needs no conflict handling.
+            _copy_sightings(sightings_buf)
+        else:
+            # unique_together (resource, collection_run) keeps re-runs idempotent
+            ResourceSighting.objects.bulk_create(
+                sightings_buf, batch_size=batch_size, ignore_conflicts=True,
+            )
 
         # ── Create Relationships ───────────────────────────────────────
-        rel_count = 0
-        for src_name, tgt_name, rel_type in rels_data:
-            src = resource_map.get(src_name)
-            tgt = resource_map.get(tgt_name)
-            if src and tgt:
-                ResourceRelationship.objects.get_or_create(
-                    source=src, target=tgt, relationship_type=rel_type,
-                )
-                rel_count += 1
-        self.stdout.write(f"    {rel_count} relationships seeded")
+        rels = [
+            ResourceRelationship(source=src, target=tgt, relationship_type=rel_type)
+            for src_name, tgt_name, rel_type in rels_data
+            if (src := resource_map.get(src_name)) and (tgt := resource_map.get(tgt_name))
+        ]
+        # unique_together (source, target, relationship_type) keeps re-runs idempotent
+        ResourceRelationship.objects.bulk_create(rels, batch_size=batch_size, ignore_conflicts=True)
+        return {
+            "provider": provider.name,
+            "status": status,
+            "resources": len(resource_map),
+            "relationships": len(rels),
+            "skipped": skipped,
+        }
@@ -10,12 +10,15 @@ Usage:
     python manage.py seed_vmware_data --flush-only  # remove without re-seeding
 """
 
+import os
 import uuid
 from django.core.management.base import BaseCommand
 import random
 from datetime import timedelta
+from types import MappingProxyType
 
 from django.db import models as db_models
+from django.db import transaction
 from django.utils import timezone
 
 from apps.core.models import Organization
@@ -211,6 +214,32 @@ VMS = [
 ]
 
 
+# VM -> infrastructure edges: (VMS key naming the target, relationship_type)
+VM_EDGE_SPECS = (
+    ("host", "runs_on"),
+    ("datastore", "attached_to"),
+    ("pool", "member_of"),
+)
+
+# VMware Tools properties by power state
+VM_TOOLS_ON = {"tools_status": "guestToolsRunning", "tools_version": "12352"}
+VM_TOOLS_OFF = {"tools_status": "guestToolsNotRunning", "tools_version": ""}
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Shared reference data; copy before handing any of it to a JSONField
+DATACENTERS = _freeze(DATACENTERS)
+VMS = _freeze(VMS)
+
+
 class Command(BaseCommand):
     help = "Seed VMware vSphere inventory data for development and testing."
 
@@ -226,27 +255,24 @@ class Command(BaseCommand):
 
         self._seed()
 
+    @transaction.atomic
     def _flush(self):
         self.stdout.write("Flushing VMware seed data...")
         provider = Provider.objects.filter(name=PROVIDER_NAME).first()
         if provider:
-            sighting_count, _ = ResourceSighting.objects.filter(
-                resource__provider=provider
-            ).delete()
-            self.stdout.write(f"  Deleted {sighting_count} sightings")
-            count, _ = Resource.objects.filter(provider=provider).delete()
-            self.stdout.write(f"  Deleted {count} resources")
-            ResourceRelationship.objects.filter(
-                source__provider=provider
-            ).delete()
-            CollectionRun.objects.filter(provider=provider).delete()
-            provider.delete()
+            # Resources, runs, sightings and relationships all hang off the
+            # provider through CASCADE FKs, so one delete collects them all.
+            _, per_model = provider.delete()
+            self.stdout.write(f"  Deleted {per_model.get(ResourceSighting._meta.label, 0)} sightings")
+            self.stdout.write(f"  Deleted {per_model.get(Resource._meta.label, 0)} resources")
             self.stdout.write(self.style.SUCCESS(f"  Deleted provider '{PROVIDER_NAME}'"))
         else:
             self.stdout.write("  No VMware seed provider found.")
 
+    @transaction.atomic
     def _seed(self):
         self.stdout.write(self.style.MIGRATE_HEADING("Seeding VMware vSphere inventory..."))
+        now = timezone.now()  # one logical collection instant for the whole seed
 
         # Get or create org
         org, _ = Organization.objects.get_or_create(
@@ -271,7 +297,7 @@ class Command(BaseCommand):
                     "username": "administrator@vsphere.local",
                 },
                 "organization": org,
-                "last_refresh_at": timezone.now(),
+                "last_refresh_at": now,
             },
         )
         action = "Created" if created else "Found existing"
@@ -282,31 +308,35 @@ class Command(BaseCommand):
             provider=provider,
             collection_type="full",
             status="completed",
-            completed_at=timezone.now(),
+            completed_at=now,
             collector_version="0.1.0-dev",
             ansible_collection="vmware.vmware",
         )
 
         # Look up resource types
-        rt = {}
-        for slug in ["virtual_machine", "hypervisor_host", "block_storage",
-                      "container_orchestration_platform", "auto_scaling_group"]:
-            try:
-                rt[slug] = ResourceType.objects.get(slug=slug)
-            except ResourceType.DoesNotExist:
+        slugs = ["virtual_machine", "hypervisor_host", "block_storage",
+                 "container_orchestration_platform", "auto_scaling_group"]
+        rt = ResourceType.objects.in_bulk(slugs, field_name="slug")
+        for slug in slugs:
+            if slug not in rt:
                 self.stderr.write(self.style.ERROR(
                     f"  ResourceType '{slug}' not found. Run migrations first."))
                 return
 
-        resources = {}  # name -> Resource for relationship building
+        # Unsaved instances, inserted in bulk after the walk. The UUID pk is
+        # assigned on construction, so relationships can reference them up front.
+        infra = []
+        vms = []
+        relationships = []
+        log_lines = []  # written in one go once the walk is done
 
         for dc_data in DATACENTERS:
             dc_name = dc_data["name"]
-            self.stdout.write(f"\n  Datacenter: {dc_name}")
+            log_lines.append(f"\n  Datacenter: {dc_name}")
 
             for cluster_data in dc_data["clusters"]:
                 # Clusters as container_orchestration_platform
-                cluster = Resource.objects.create(
+                cluster = Resource(
                     resource_type=rt["container_orchestration_platform"],
                     provider=provider,
                     name=cluster_data["name"],
@@ -324,13 +354,13 @@ class Command(BaseCommand):
                     collection_run=run,
                     organization=org,
                 )
-                resources[cluster_data["name"]] = cluster
-                self.stdout.write(f"    Cluster: {cluster.name}")
+                infra.append(cluster)
+                log_lines.append(f"    Cluster: {cluster.name}")
 
                 # Hosts
                 for host_data in cluster_data["hosts"]:
                     smbios_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, host_data["serial"]))
-                    host = Resource.objects.create(
+                    host = Resource(
                         resource_type=rt["hypervisor_host"],
                         provider=provider,
                         name=host_data["name"],
@@ -360,18 +390,17 @@ class Command(BaseCommand):
                         collection_run=run,
                         organization=org,
                     )
-                    resources[host_data["name"]] = host
-                    self.stdout.write(f"      Host: {host.name} ({host_data['cpu_count']} CPU, {host_data['memory_mb'] // 1024}GB RAM)")
+                    infra.append(host)
+                    log_lines.append(f"      Host: {host.name} ({host_data['cpu_count']} CPU, {host_data['memory_mb'] // 1024}GB RAM)")
 
                     # host → cluster: part_of
-                    ResourceRelationship.objects.create(
-                        source=host, target=cluster,
-                        relationship_type="part_of",
-                    )
+                    relationships.append(ResourceRelationship(
+                        source=host, target=cluster, relationship_type="part_of",
+                    ))
 
                 # Resource pools
                 for pool_data in cluster_data["resource_pools"]:
-                    pool = Resource.objects.create(
+                    pool = Resource(
                         resource_type=rt["auto_scaling_group"],
                         provider=provider,
                         name=pool_data["name"],
@@ -390,18 +419,17 @@ class Command(BaseCommand):
                         collection_run=run,
                         organization=org,
                     )
-                    resources[pool_data["name"]] = pool
-                    self.stdout.write(f"      Pool: {pool.name}")
+                    infra.append(pool)
+                    log_lines.append(f"      Pool: {pool.name}")
 
                     # pool → cluster: part_of
-                    ResourceRelationship.objects.create(
-                        source=pool, target=cluster,
-                        relationship_type="part_of",
-                    )
+                    relationships.append(ResourceRelationship(
+                        source=pool, target=cluster, relationship_type="part_of",
+                    ))
 
             # Datastores
             for ds_data in dc_data["datastores"]:
-                ds = Resource.objects.create(
+                ds = Resource(
                     resource_type=rt["block_storage"],
                     provider=provider,
                     name=ds_data["name"],
@@ -422,14 +450,16 @@ class Command(BaseCommand):
                     collection_run=run,
                     organization=org,
                 )
-                resources[ds_data["name"]] = ds
-                self.stdout.write(f"    Datastore: {ds.name} ({ds_data['type']}, {ds_data['capacity_gb']}GB)")
+                infra.append(ds)
+                log_lines.append(f"    Datastore: {ds.name} ({ds_data['type']}, {ds_data['capacity_gb']}GB)")
+
+        resources = {r.name: r for r in infra}  # name -> Resource for relationship building
 
         # VMs
-        self.stdout.write(f"\n  Virtual Machines:")
+        log_lines.append(f"\n  Virtual Machines:")
         for vm_data in VMS:
-            mac = f"00:50:56:{uuid.uuid4().hex[:2]}:{uuid.uuid4().hex[:2]}:{uuid.uuid4().hex[:2]}"
-            vm = Resource.objects.create(
+            mac = "00:50:56:" + os.urandom(3).hex(":")
+            vm = Resource(
                 resource_type=rt["virtual_machine"],
                 provider=provider,
                 name=vm_data["name"],
@@ -447,7 +477,7 @@ class Command(BaseCommand):
                 cpu_count=vm_data["cpu"],
                 memory_mb=vm_data["mem"],
                 disk_gb=vm_data["disk"],
-                ip_addresses=vm_data["ip"],
+                ip_addresses=list(vm_data["ip"]),
                 fqdn=vm_data["fqdn"],
                 mac_addresses=[mac],
                 os_type=vm_data["os_type"],
@@ -458,51 +488,42 @@ class Command(BaseCommand):
                     "host": vm_data["host"],
                     "resource_pool": vm_data["pool"],
                     "datastore": vm_data["datastore"],
-                    "tools_status": "guestToolsRunning" if vm_data["power"] == "poweredOn" else "guestToolsNotRunning",
-                    "tools_version": "12352" if vm_data["power"] == "poweredOn" else "",
+                    **(VM_TOOLS_ON if vm_data["power"] == "poweredOn" else VM_TOOLS_OFF),
                     "hardware_version": "vmx-21",
                 },
-                provider_tags=vm_data["tags"],
+                provider_tags=dict(vm_data["tags"]),
                 ansible_host=vm_data["ip"][0] if vm_data["ip"] else "",
-                ansible_connection=vm_data.get("ansible_conn", ""),
-                inventory_group=vm_data.get("ansible_group", ""),
+                ansible_connection=vm_data["ansible_conn"],
+                inventory_group=vm_data["ansible_group"],
                 collection_run=run,
                 organization=org,
             )
-            resources[vm_data["name"]] = vm
+            vms.append(vm)
             state_icon = "🟢" if vm_data["state"] == "running" else "🔴" if vm_data["state"] == "stopped" else "🟡"
-            self.stdout.write(f"    {state_icon} {vm.name} ({vm_data['os_name']}, {vm_data['cpu']}vCPU/{vm_data['mem']//1024}GB)")
+            log_lines.append(f"    {state_icon} {vm.name} ({vm_data['os_name']}, {vm_data['cpu']}vCPU/{vm_data['mem']//1024}GB)")
 
-            # VM → host: runs_on
-            if vm_data["host"] in resources:
-                ResourceRelationship.objects.create(
-                    source=vm, target=resources[vm_data["host"]],
-                    relationship_type="runs_on",
-                )
+            relationships.extend(
+                ResourceRelationship(source=vm, target=target, relationship_type=rel_type)
+                for key, rel_type in VM_EDGE_SPECS
+                if (target := resources.get(vm_data[key])) is not None
+            )
+        resources.update({vm.name: vm for vm in vms})
 
-            # VM → datastore: attached_to
-            if vm_data["datastore"] in resources:
-                ResourceRelationship.objects.create(
-                    source=vm, target=resources[vm_data["datastore"]],
-                    relationship_type="attached_to",
-                )
+        self.stdout.write("\n".join(log_lines))
 
-            # VM → resource pool: member_of
-            if vm_data["pool"] in resources:
-                ResourceRelationship.objects.create(
-                    source=vm, target=resources[vm_data["pool"]],
-                    relationship_type="member_of",
-                )
+        Resource.objects.bulk_create(infra, batch_size=500)
+        Resource.objects.bulk_create(vms, batch_size=500)
+        ResourceRelationship.objects.bulk_create(relationships, batch_size=1000)
 
         # Update collection run stats
-        total = Resource.objects.filter(provider=provider).count()
-        rels = ResourceRelationship.objects.filter(source__provider=provider).count()
+        total = len(infra) + len(vms)
+        rels = len(relationships)
         run.resources_found = total
         run.resources_created = total
         run.save(update_fields=["resources_found", "resources_created"])
 
         # Create historical sighting data (simulates 7 previous collection runs)
-        sighting_count = self._create_sighting_history(provider, resources, run)
+        sighting_count = self._create_sighting_history(provider, resources, run, now)
 
         self.stdout.write("\n" + self.style.SUCCESS(
             f"Done! Seeded {total} resources, {rels} relationships, "
@@ -511,7 +532,7 @@ class Command(BaseCommand):
         self.stdout.write(f"  Provider ID: {provider.id}")
         self.stdout.write(f"  Collection Run ID: {run.id}")
 
-    def _create_sighting_history(self, provider, resources, current_run):
+    def _create_sighting_history(self, provider, resources, current_run, now):
         """
         Create simulated historical collection runs and resource sightings.
 
@@ -525,7 +546,6 @@ class Command(BaseCommand):
         endpoints with meaningful time-series data.
         """
         self.stdout.write("\n  Creating sighting history (7 past collection runs)...")
-        now = timezone.now()
         sighting_count = 0
 
         for days_ago in range(7, 0, -1):
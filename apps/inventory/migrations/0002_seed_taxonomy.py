@@ -13,7 +13,7 @@ from django.db import migrations
 
 # ─── Taxonomy seed data ────────────────────────────────────────────────────
 
-CATEGORIES = [
+CATEGORIES = (
     # (slug, name, description, sort_order)
     ("compute", "Compute", "Virtual machines, containers, hypervisors, bare metal, serverless, auto-scaling", 10),
     ("storage", "Storage", "Object, block, file, and archive storage", 20),
@@ -30,11 +30,11 @@ CATEGORIES = [
     ("governance_ops", "Governance & Operations", "ITSM, CMDB, cost management, vulnerability management, secrets, DLP", 130),
     ("hybrid_edge", "Hybrid & Edge", "Dedicated connections, edge compute, edge orchestration", 140),
     ("migration", "Migration & Data Transfer", "Data migration, VM migration, data transfer services", 150),
-]
+)
 
 
 # (slug, category_slug, name, is_countable, ltsv, sto, sort_order)
-RESOURCE_TYPES = [
+RESOURCE_TYPES = (
     # ─── Compute ───
     ("virtual_machine", "compute", "Virtual Machine", True, 5, 5, 10),
     ("container", "compute", "Container", True, 5, 4, 20),
@@ -142,13 +142,13 @@ RESOURCE_TYPES = [
     ("data_migration_tool", "migration", "Data Migration / Transfer Tool", True, 3, 1, 10),
     ("vm_migration_tool", "migration", "VM Migration Tool", True, 3, 1, 20),
     ("db_migration_service", "migration", "Database Migration Service", True, 2, 1, 30),
-]
+)
 
 
 # ─── Vendor-to-normalized mappings from the taxonomy document ──────────────
 # (vendor, vendor_resource_type, resource_type_slug, ansible_collection)
 
-VENDOR_MAPPINGS = [
+VENDOR_MAPPINGS = (
     # === Public Cloud — AWS ===
     ("aws", "EC2 Instance", "virtual_machine", "amazon.aws"),
     ("aws", "Auto Scaling Group", "auto_scaling_group", "amazon.aws"),
@@ -407,7 +407,7 @@ VENDOR_MAPPINGS = [
     ("ibm_storage", "Spectrum Protect", "data_migration_tool", "ibm.storage_virtualize"),
     ("ibm_storage", "IBM CSI for Spectrum Scale", "block_storage", "ibm.storage_virtualize"),
     ("ibm_storage", "Storage Insights", "monitoring_logging_platform", "ibm.storage_virtualize"),
-]
+)
 
 
 def seed_taxonomy(apps, schema_editor):
@@ -416,45 +416,65 @@ def seed_taxonomy(apps, schema_editor):
     ResourceType = apps.get_model("inventory", "ResourceType")
     VendorTypeMapping = apps.get_model("inventory", "VendorTypeMapping")
 
+    # Only insert what is missing, so a re-run is just a few SELECTs
+    existing_cats = set(ResourceCategory.objects.values_list("slug", flat=True))
+    existing_types = set(ResourceType.objects.values_list("slug", flat=True))
+    existing_mappings = set(
+        VendorTypeMapping.objects.values_list("vendor", "vendor_resource_type")
+    )
+
     # Create categories
-    cat_map = {}
-    for slug, name, description, sort_order in CATEGORIES:
-        cat, _ = ResourceCategory.objects.get_or_create(
-            slug=slug,
-            defaults={
-                "name": name,
-                "description": description,
-                "sort_order": sort_order,
-            },
-        )
-        cat_map[slug] = cat
+    ResourceCategory.objects.bulk_create(
+        [
+            ResourceCategory(
+                slug=slug,
+                name=name,
+                description=description,
+                sort_order=sort_order,
+            )
+            for slug, name, description, sort_order in CATEGORIES
+            if slug not in existing_cats
+        ],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+    cat_ids = dict(ResourceCategory.objects.values_list("slug", "id"))
 
     # Create resource types
-    rt_map = {}
-    for slug, cat_slug, name, is_countable, ltsv, sto, sort_order in RESOURCE_TYPES:
-        rt, _ = ResourceType.objects.get_or_create(
-            slug=slug,
-            defaults={
-                "category": cat_map[cat_slug],
-                "name": name,
-                "is_countable": is_countable,
-                "long_term_strategic_value": ltsv,
-                "short_term_opportunity": sto,
-                "sort_order": sort_order,
-            },
-        )
-        rt_map[slug] = rt
+    ResourceType.objects.bulk_create(
+        [
+            ResourceType(
+                slug=slug,
+                category_id=cat_ids[cat_slug],
+                name=name,
+                is_countable=is_countable,
+                long_term_strategic_value=ltsv,
+                short_term_opportunity=sto,
+                sort_order=sort_order,
+            )
+            for slug, cat_slug, name, is_countable, ltsv, sto, sort_order in RESOURCE_TYPES
+            if slug not in existing_types
+        ],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+    rt_ids = dict(ResourceType.objects.values_list("slug", "id"))
 
     # Create vendor mappings
-    for vendor, vendor_type, rt_slug, collection in VENDOR_MAPPINGS:
-        VendorTypeMapping.objects.get_or_create(
-            vendor=vendor,
-            vendor_resource_type=vendor_type,
-            defaults={
-                "resource_type": rt_map[rt_slug],
-                "ansible_collection": collection,
-            },
-        )
+    VendorTypeMapping.objects.bulk_create(
+        [
+            VendorTypeMapping(
+                vendor=vendor,
+                vendor_resource_type=vendor_type,
+                resource_type_id=rt_ids[rt_slug],
+                ansible_collection=collection,
+            )
+            for vendor, vendor_type, rt_slug, collection in VENDOR_MAPPINGS
+            if (vendor, vendor_type) not in existing_mappings
+        ],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
 
 
 def reverse_taxonomy(apps, schema_editor):
@@ -7,64 +7,82 @@ def seed_missing_types(apps, schema_editor):
     ResourceCategory = apps.get_model("inventory", "ResourceCategory")
     VendorTypeMapping = apps.get_model("inventory", "VendorTypeMapping")
 
-    compute = ResourceCategory.objects.get(slug="compute")
-    app_int = ResourceCategory.objects.get(slug="app_integration")
-
-    # physical_server — bare-metal or managed physical hosts (OpenShift workers, etc.)
-    ps, _ = ResourceType.objects.get_or_create(
-        slug="physical_server",
-        defaults={
-            "category": compute,
-            "name": "Physical Server",
-            "description": "A physical server or managed node (e.g. OpenShift worker, bare-metal host).",
-            "is_countable": True,
-            "long_term_strategic_value": 4,
-            "short_term_opportunity": 3,
-            "sort_order": 45,
-        },
+    cat_ids = dict(
+        ResourceCategory.objects.filter(
+            slug__in=["compute", "app_integration"],
+        ).values_list("slug", "id")
     )
 
-    # orchestration_stack — Heat, CloudFormation, ARM, Terraform state, etc.
-    os_type, _ = ResourceType.objects.get_or_create(
-        slug="orchestration_stack",
-        defaults={
-            "category": app_int,
-            "name": "Orchestration Stack",
-            "description": "A declarative infrastructure stack (Heat, CloudFormation, ARM template, etc.).",
-            "is_countable": False,
-            "long_term_strategic_value": 3,
-            "short_term_opportunity": 2,
-            "sort_order": 65,
-        },
+    ResourceType.objects.bulk_create(
+        [
+            # physical_server — bare-metal or managed physical hosts (OpenShift workers, etc.)
+            ResourceType(
+                slug="physical_server",
+                category_id=cat_ids["compute"],
+                name="Physical Server",
+                description="A physical server or managed node (e.g. OpenShift worker, bare-metal host).",
+                is_countable=True,
+                long_term_strategic_value=4,
+                short_term_opportunity=3,
+                sort_order=45,
+            ),
+            # orchestration_stack — Heat, CloudFormation, ARM, Terraform state, etc.
+            ResourceType(
+                slug="orchestration_stack",
+                category_id=cat_ids["app_integration"],
+                name="Orchestration Stack",
+                description="A declarative infrastructure stack (Heat, CloudFormation, ARM template, etc.).",
+                is_countable=False,
+                long_term_strategic_value=3,
+                short_term_opportunity=2,
+                sort_order=65,
+            ),
+        ],
+        ignore_conflicts=True,
+    )
+    rt_ids = dict(
+        ResourceType.objects.filter(
+            slug__in=["physical_server", "orchestration_stack"],
+        ).values_list("slug", "id")
     )
 
     # Vendor type mappings
     mappings = [
-        ("openshift", "Worker Node", ps, "kubernetes.core"),
-        ("openshift", "Master Node", ps, "kubernetes.core"),
-        ("vmware", "ESXi Host", ps, "vmware.vmware"),
-        ("openstack", "Heat Stack", os_type, "openstack.cloud"),
-        ("aws", "CloudFormation Stack", os_type, "amazon.aws"),
-        ("azure", "ARM Deployment", os_type, "azure.azcollection"),
-        ("gcp", "Deployment Manager", os_type, "google.cloud"),
+        ("openshift", "Worker Node", "physical_server", "kubernetes.core"),
+        ("openshift", "Master Node", "physical_server", "kubernetes.core"),
+        ("vmware", "ESXi Host", "physical_server", "vmware.vmware"),
+        ("openstack", "Heat Stack", "orchestration_stack", "openstack.cloud"),
+        ("aws", "CloudFormation Stack", "orchestration_stack", "amazon.aws"),
+        ("azure", "ARM Deployment", "orchestration_stack", "azure.azcollection"),
+        ("gcp", "Deployment Manager", "orchestration_stack", "google.cloud"),
     ]
-    for vendor, vrt, rt, collection in mappings:
-        VendorTypeMapping.objects.get_or_create(
-            vendor=vendor,
-            vendor_resource_type=vrt,
-            defaults={
-                "resource_type": rt,
-                "ansible_collection": collection,
-            },
-        )
+    # Only insert the ones not already present
+    existing = set(
+        VendorTypeMapping.objects.filter(
+            vendor__in={vendor for vendor, *_ in mappings},
+        ).values_list("vendor", "vendor_resource_type")
+    )
+    VendorTypeMapping.objects.bulk_create(
+        [
+            VendorTypeMapping(
+                vendor=vendor,
+                vendor_resource_type=vrt,
+                resource_type_id=rt_ids[rt_slug],
+                ansible_collection=collection,
+            )
+            for vendor, vrt, rt_slug, collection in mappings
+            if (vendor, vrt) not in existing
+        ],
+        ignore_conflicts=True,
+    )
 
 
 def remove_types(apps, schema_editor):
     ResourceType = apps.get_model("inventory", "ResourceType")
     VendorTypeMapping = apps.get_model("inventory", "VendorTypeMapping")
-    for slug in ("physical_server", "orchestration_stack"):
-        VendorTypeMapping.objects.filter(resource_type__slug=slug).delete()
-        ResourceType.objects.filter(slug=slug).delete()
+    slugs = ("physical_server", "orchestration_stack")
+    VendorTypeMapping.objects.filter(resource_type__slug__in=slugs).delete()
+    ResourceType.objects.filter(slug__in=slugs).delete()
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:15
+
+from django.db import migrations, models
+
+
+# Covering index for the collector's (provider, ems_ref) -> id lookups —
+# PostgreSQL only.  INCLUDE makes them index-only scans; other backends keep
+# using the unique_together index.
+def _create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE INDEX IF NOT EXISTS "inventory_r_prov_emsref_cov" ON "inventory_resource" ("provider_id", "ems_ref") INCLUDE ("id", "state", "last_seen_at");')
+
+def _drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS "inventory_r_prov_emsref_cov";')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0007_drift_tracking'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resource',
+            name='ems_ref',
+            field=models.CharField(help_text='Provider-native unique reference (ManageIQ: ems_ref). E.g. AWS instance ID, vSphere MOID, Cisco serial number.', max_length=1024),
+        ),
+        migrations.RunPython(
+            code=_create_covering_index,
+            reverse_code=_drop_covering_index,
+        ),
+    ]
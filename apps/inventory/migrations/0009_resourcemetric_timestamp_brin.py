@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:16
+
+from django.db import migrations, models
+
+
+# BRIN index for the append-only metric timeline — PostgreSQL only
+def _create_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE INDEX IF NOT EXISTS "inventory_rm_ts_brin" ON "inventory_resourcemetric" USING brin ("timestamp") WITH (pages_per_range = 32);')
+
+def _drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS "inventory_rm_ts_brin";')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0008_resource_provider_ems_ref_covering_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resourcemetric',
+            name='timestamp',
+            field=models.DateTimeField(help_text='When this metric was captured.'),
+        ),
+        migrations.RunPython(
+            code=_create_brin_index,
+            reverse_code=_drop_brin_index,
+        ),
+    ]
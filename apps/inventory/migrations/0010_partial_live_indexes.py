@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0009_resourcemetric_timestamp_brin'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='resource',
+            name='inventory_r_resourc_8568bd_idx',
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(condition=models.Q(('state__in', ['terminated', 'decommissioned']), _negated=True), fields=['resource_type', 'state'], name='inventory_r_live_type_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:18
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0010_partial_live_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resource',
+            name='first_discovered_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='When this resource was first discovered.'),
+        ),
+        migrations.AlterField(
+            model_name='resourcesighting',
+            name='seen_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), db_index=True, editable=False, help_text='Timestamp of the observation.'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0011_db_default_timestamps'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resourcecategory',
+            name='sort_order',
+            field=models.SmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='resourcetype',
+            name='long_term_strategic_value',
+            field=models.SmallIntegerField(blank=True, help_text='LTSV score (1-5) from the normalized taxonomy.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='resourcetype',
+            name='short_term_opportunity',
+            field=models.SmallIntegerField(blank=True, help_text='STO / metrics-utility fit score (1-5).', null=True),
+        ),
+        migrations.AlterField(
+            model_name='resourcetype',
+            name='sort_order',
+            field=models.SmallIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:24
+
+from django.db import migrations
+
+
+# Expression index for case-insensitive prefix search on Resource.name —
+# PostgreSQL only.  Django compiles name__istartswith to
+# UPPER("name"::text) LIKE UPPER(%s), so the index is built on upper(name)
+# to match; text_pattern_ops lets LIKE 'abc%' use it under any collation.
+def _create_name_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE INDEX IF NOT EXISTS "idx_resource_name_upper" ON "inventory_resource" (upper("name") text_pattern_ops);')
+
+def _drop_name_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS "idx_resource_name_upper";')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0012_taxonomy_smallint_scores'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=_create_name_prefix_index,
+            reverse_code=_drop_name_prefix_index,
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:26
+
+from django.db import migrations
+
+
+# Trigram GIN indexes for substring search on Resource.name / ems_ref —
+# PostgreSQL only.  Built on upper(...) to match Django's icontains SQL
+# (UPPER(col::text) LIKE UPPER('%term%')) so ORM lookups can use them.
+def _create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+        schema_editor.execute('CREATE INDEX IF NOT EXISTS "idx_resource_name_trgm" ON "inventory_resource" USING gin (upper("name") gin_trgm_ops);')
+        schema_editor.execute('CREATE INDEX IF NOT EXISTS "idx_resource_emsref_trgm" ON "inventory_resource" USING gin (upper("ems_ref") gin_trgm_ops);')
+
+def _drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS "idx_resource_name_trgm";')
+        schema_editor.execute('DROP INDEX IF EXISTS "idx_resource_emsref_trgm";')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0013_resource_name_prefix_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=_create_trgm_indexes,
+            reverse_code=_drop_trgm_indexes,
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0014_resource_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='collectionrun',
+            name='inventory_c_status_7b90a1_idx',
+        ),
+        migrations.AlterField(
+            model_name='collectionrun',
+            name='task_uuid',
+            field=models.CharField(blank=True, default='', help_text='UUID of the dispatcherd background task running this collection.', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='collectionrun',
+            index=models.Index(fields=['status', '-started_at'], name='inventory_c_status_af9986_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='collectionrun',
+            index=models.Index(fields=['provider', 'status', '-started_at'], name='inventory_c_provide_f2831c_idx'),
+        ),
+    ]
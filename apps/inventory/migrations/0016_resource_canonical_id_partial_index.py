@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0015_collectionrun_index_cleanup'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='resource',
+            name='inventory_r_canonic_5b8a42_idx',
+        ),
+        migrations.AlterField(
+            model_name='resource',
+            name='canonical_id',
+            field=models.CharField(blank=True, default='', help_text='Stable cross-provider asset fingerprint. For compute resources this is typically the SMBIOS UUID, which persists across provider boundaries (e.g. the same physical machine seen via VMware and via bare-metal IPMI). For cloud resources, use the most stable vendor identifier (e.g. EC2 instance-id). Collectors are responsible for determining the best canonical_id for each resource type.', max_length=1024),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(condition=models.Q(('canonical_id', ''), _negated=True), fields=['canonical_id'], name='inventory_r_canonical_idx'),
+        ),
+    ]
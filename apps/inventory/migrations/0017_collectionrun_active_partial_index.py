@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('inventory', '0016_resource_canonical_id_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collectionrun',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'running'])), fields=['provider', '-started_at'], name='inventory_c_active_idx'),
+        ),
+    ]
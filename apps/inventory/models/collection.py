@@ -75,7 +75,6 @@ class CollectionRun(models.Model):
         max_length=64,
         blank=True,
         default="",
-        db_index=True,
         help_text="UUID of the dispatcherd background task running this collection.",
     )
 
@@ -126,7 +125,16 @@ class CollectionRun(models.Model):
         ordering = ["-started_at"]
         indexes = [
             models.Index(fields=["provider", "-started_at"]),
-            models.Index(fields=["status"]),
+            # ?status= on the runs list spans providers, newest first
+            models.Index(fields=["status", "-started_at"]),
+            # Previous-completed-run lookup in the collection task
+            models.Index(fields=["provider", "status", "-started_at"]),
+            # In-flight runs only; stays tiny however many finished runs pile up
+            models.Index(
+                fields=["provider", "-started_at"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="inventory_c_active_idx",
+            ),
             models.Index(fields=["task_uuid"]),
         ]
 
@@ -26,6 +26,7 @@ Design rationale:
 import uuid
 
 from django.db import models
+from django.db.models.functions import Now
 
 
 class ResourceState(models.TextChoices):
@@ -87,7 +88,6 @@ class Resource(models.Model):
 
     ems_ref = models.CharField(
         max_length=1024,
-        db_index=True,
         help_text="Provider-native unique reference (ManageIQ: ems_ref). "
         "E.g. AWS instance ID, vSphere MOID, Cisco serial number.",
     )
@@ -99,7 +99,6 @@ class Resource(models.Model):
         max_length=1024,
         blank=True,
         default="",
-        db_index=True,
         help_text="Stable cross-provider asset fingerprint. For compute resources "
         "this is typically the SMBIOS UUID, which persists across provider "
         "boundaries (e.g. the same physical machine seen via VMware and via "
@@ -280,8 +279,11 @@ class Resource(models.Model):
     )
 
     # === Collection Tracking ===
+    # Filled by the database (DEFAULT now()) so bulk and COPY ingest can
+    # leave it out of the INSERT entirely.
     first_discovered_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="When this resource was first discovered.",
     )
     last_seen_at = models.DateTimeField(
@@ -351,14 +353,28 @@ class Resource(models.Model):
         # A resource is uniquely identified by its provider + native ref
         unique_together = [("provider", "ems_ref")]
         indexes = [
-            models.Index(fields=["resource_type", "state"]),
+            # Live inventory only; retired rows stay out of the index entirely
+            # (lookups by type alone still have the resource_type FK index)
+            models.Index(
+                fields=["resource_type", "state"],
+                condition=~models.Q(state__in=[ResourceState.TERMINATED, ResourceState.DECOMMISSIONED]),
+                name="inventory_r_live_type_idx",
+            ),
             models.Index(fields=["provider", "resource_type"]),
             models.Index(fields=["organization", "resource_type"]),
             models.Index(fields=["region"]),
             models.Index(fields=["vendor_type"]),
-            models.Index(fields=["canonical_id"]),
+            # Many resource types have no stable fingerprint; leave the
+            # empty canonical_ids out of the index.
+            models.Index(
+                fields=["canonical_id"],
+                condition=~models.Q(canonical_id=""),
+                name="inventory_r_canonical_idx",
+            ),
             models.Index(fields=["seen_count"]),
             models.Index(fields=["last_seen_at"]),
+            # (provider, ems_ref) INCLUDE (id, state, last_seen_at) covering
+            # index is PostgreSQL-only and created in migration 0008.
             # GIN index for JSONB properties queries
             models.Index(
                 name="idx_resource_properties_gin",
@@ -474,7 +490,8 @@ class ResourceSighting(models.Model):
     )
 
     seen_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         db_index=True,
         help_text="Timestamp of the observation.",
     )
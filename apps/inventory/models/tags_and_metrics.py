@@ -93,8 +93,9 @@ class ResourceMetric(models.Model):
         on_delete=models.CASCADE,
         related_name="metrics",
     )
+    # Append-only and time-ordered: PostgreSQL gets a BRIN index on this
+    # column (migration 0009) instead of a full B-tree.
     timestamp = models.DateTimeField(
-        db_index=True,
         help_text="When this metric was captured.",
     )
 
@@ -47,7 +47,7 @@ class ResourceCategory(models.Model):
     description = models.TextField(blank=True, default="")
 
     # Ordering for UI display
-    sort_order = models.IntegerField(default=0)
+    sort_order = models.SmallIntegerField(default=0)
 
     class Meta:
         ordering = ["sort_order", "name"]
@@ -99,18 +99,18 @@ class ResourceType(models.Model):
     )
 
     # Strategic value scores from the taxonomy doc
-    long_term_strategic_value = models.IntegerField(
+    long_term_strategic_value = models.SmallIntegerField(
         null=True,
         blank=True,
         help_text="LTSV score (1-5) from the normalized taxonomy.",
     )
-    short_term_opportunity = models.IntegerField(
+    short_term_opportunity = models.SmallIntegerField(
         null=True,
         blank=True,
         help_text="STO / metrics-utility fit score (1-5).",
     )
 
-    sort_order = models.IntegerField(default=0)
+    sort_order = models.SmallIntegerField(default=0)
 
     class Meta:
         ordering = ["category", "sort_order", "name"]
@@ -21,6 +21,17 @@ class ResourceFilter(filters.FilterSet):
     canonical_id_contains = filters.CharFilter(
         field_name="canonical_id", lookup_expr="icontains"
     )
+    # Served by the upper(name) expression index on PostgreSQL (migration 0013)
+    name_startswith = filters.CharFilter(
+        field_name="name", lookup_expr="istartswith"
+    )
+    # Served by the pg_trgm indexes on PostgreSQL (migration 0014)
+    name_contains = filters.CharFilter(
+        field_name="name", lookup_expr="icontains"
+    )
+    ems_ref_contains = filters.CharFilter(
+        field_name="ems_ref", lookup_expr="icontains"
+    )
     seen_count_min = filters.NumberFilter(field_name="seen_count", lookup_expr="gte")
     seen_count_max = filters.NumberFilter(field_name="seen_count", lookup_expr="lte")
     first_discovered_after = filters.DateTimeFilter(
@@ -58,7 +69,10 @@ class ResourceFilter(filters.FilterSet):
 
 
 class ResourceViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
-    queryset = Resource.objects.select_related("resource_type", "provider").all()
+    # resource_type_name renders "<category> → <type>", so pull the category too
+    queryset = Resource.objects.select_related(
+        "resource_type", "resource_type__category", "provider"
+    ).all()
     serializer_class = ResourceSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = ResourceFilter
@@ -82,7 +96,7 @@ class ResourceViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
         """
         resource = self.get_object()
         qs = ResourceSighting.objects.filter(resource=resource).select_related(
-            "collection_run"
+            "resource__resource_type", "collection_run"
         ).order_by("-seen_at")
 
         # Apply optional date range filters
@@ -192,7 +206,10 @@ class ResourceViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
 
 
 class ResourceRelationshipViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet):
-    queryset = ResourceRelationship.objects.select_related("source", "target").all()
+    # source_name/target_name use Resource.__str__, which reads resource_type.slug
+    queryset = ResourceRelationship.objects.select_related(
+        "source", "source__resource_type", "target", "target__resource_type"
+    ).all()
     serializer_class = ResourceRelationshipSerializer
     permission_classes = [IsAuthenticated]
     filterset_fields = ["relationship_type", "source", "target"]
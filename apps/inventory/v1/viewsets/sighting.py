@@ -37,7 +37,7 @@ class ResourceSightingViewSet(
     """
 
     queryset = ResourceSighting.objects.select_related(
-        "resource", "collection_run"
+        "resource", "resource__resource_type", "collection_run"
     ).all()
     serializer_class = ResourceSightingSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]